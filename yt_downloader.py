@@ -16,37 +16,52 @@ Requirements:
 FFmpeg required in PATH for trimming/conversion.
 """
 
-import os, sys, json, time, threading, queue, subprocess
+import os, sys, json, time, threading, subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter.ttk import Combobox, Progressbar
 from ttkthemes import ThemedTk
 import yt_dlp
+from yt_dlp.utils import DownloadCancelled, DownloadError
 import pyperclip
 import requests
+from requests.adapters import HTTPAdapter
 
 # ---------------- Config ----------------
 DEFAULT_SAVE = os.path.join(os.path.expanduser("~"), "Downloads")
-HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".yt_downloader_history.json")
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".yt_downloader_history.jsonl")  # one JSON object per line, oldest first
+LEGACY_HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".yt_downloader_history.json")
 FFMPEG_CMD = "ffmpeg"  # must be in PATH
 MAX_WORKERS = 2  # concurrent downloads default
+PP_WORKERS = 1  # concurrent ffmpeg post-processing jobs
+FRAGMENT_WORKERS = 4  # parallel fragment fetches per DASH/HLS download
+INFO_CACHE_TTL = 300  # seconds an Estimate lookup stays reusable
+INFO_CACHE_SIZE = 32
+HISTORY_ROWS = 100  # entries shown in the history list
+
+# shared HTTP session so repeated speed tests reuse warm keep-alive sockets
+_SPEED_SESSION = requests.Session()
+_SPEED_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_SPEED_SESSION.mount("http://", _SPEED_ADAPTER)
+_SPEED_SESSION.mount("https://", _SPEED_ADAPTER)
 
 # ---------------- Helpers ----------------
+_BAD_TRANS = str.maketrans('', '', '<>:"/\\|?*\n\r\t')
+
 def safe_filename(name):
     # Keep it short and safe for Windows
-    bad = '<>:"/\\|?*\n\r\t'
-    for c in bad:
-        name = name.replace(c, '')
-    return name[:120].strip()
+    return name.translate(_BAD_TRANS)[:120].strip()
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def human_size(bytesize):
     if not bytesize:
         return "Unknown"
-    for unit in ['B','KB','MB','GB','TB']:
-        if bytesize < 1024:
-            return f"{bytesize:.2f} {unit}"
-        bytesize /= 1024
-    return f"{bytesize:.2f} PB"
+    # each unit is 2**10 of the previous one, so bit_length picks it directly
+    idx = min(max(int(bytesize).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytesize / (1 << (10 * idx)):.2f} {_SIZE_UNITS[idx]}"
 
 def quick_speed_test():
     # Downloads a small resource to estimate bandwidth (bytes/sec)
@@ -55,47 +70,140 @@ def quick_speed_test():
         "https://www.cloudflare.com/img/cf-horizontal-bw.svg"
     ]
     for u in urls:
+        r = None
         try:
-            t0 = time.time()
-            r = requests.get(u, stream=True, timeout=6)
-            total = 0
-            for chunk in r.iter_content(8192):
-                total += len(chunk)
-                if total > 200000:  # ~200 KB enough
-                    break
-            t1 = time.time()
-            if t1 - t0 > 0:
+            # time the whole request: these probes are small enough that the
+            # body usually arrives in the same buffer as the headers
+            t0 = time.monotonic()
+            r = _SPEED_SESSION.get(u, stream=True, timeout=6)
+            r.raw.decode_content = True
+            # one read instead of a bytes object per chunk
+            total = len(r.raw.read(200000))  # ~200 KB enough
+            t1 = time.monotonic()
+            if total and t1 - t0 > 0:
                 return total / (t1 - t0)  # bytes/sec
         except Exception:
             continue
+        finally:
+            if r is not None:
+                r.close()
     return None
 
-# ---------------- Worker Thread ----------------
-class DownloadWorker(threading.Thread):
-    def __init__(self, tasks_q, ui):
-        super().__init__(daemon=True)
-        self.q = tasks_q
+def normalize_ts(ts):
+    # seconds or HH:MM:SS -> HH:MM:SS for ffmpeg (None if empty/invalid)
+    s = ts.strip()
+    if not s:
+        return None
+    if ':' in s:
+        return s
+    try:
+        sec = int(float(s))
+        h = sec // 3600
+        m = (sec % 3600) // 60
+        sec = sec % 60
+        return f"{h:02d}:{m:02d}:{sec:02d}"
+    except:
+        return None
+
+def ts_seconds(ts):
+    # HH:MM:SS[.ms] / MM:SS / seconds -> float seconds
+    try:
+        return sum(float(p) * 60 ** i for i, p in enumerate(reversed(ts.split(':'))))
+    except ValueError:
+        return 0.0
+
+def replace_output(tmp_path, final_path, src_path):
+    # Atomically move ffmpeg output into place; the source only needs
+    # removing when the final name differs (e.g. .webm -> .mp3)
+    os.replace(tmp_path, final_path)
+    if os.path.normcase(os.path.abspath(src_path)) != os.path.normcase(os.path.abspath(final_path)):
+        os.remove(src_path)
+    return final_path
+
+def discard(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def run_ffmpeg(cmd, duration=None, on_progress=None, cancel=None):
+    # Runs ffmpeg with machine-readable progress on stdout, reporting percent
+    # of `duration` (seconds) to on_progress; returns the exit code.
+    # Kills ffmpeg and raises DownloadCancelled once `cancel` (an Event) is set
+    cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + cmd[1:]
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, bufsize=1 << 16)
+
+    # read until EOF on this thread: if stdout stops being drained, ffmpeg
+    # blocks on the full pipe and never exits
+    with proc.stdout:
+        for line in proc.stdout:
+            if cancel is not None and cancel.is_set() and proc.poll() is None:
+                proc.kill()  # keep reading; EOF follows shortly
+            key, _, val = line.decode('ascii', 'replace').strip().partition('=')
+            # out_time_ms is in microseconds despite its name
+            if key == 'out_time_ms' and duration and on_progress:
+                try:
+                    on_progress(min(int(val) / (duration * 10000), 100))
+                except Exception:
+                    pass  # bad value, or the UI is gone (TclError)
+    rc = proc.wait()
+    if cancel is not None and cancel.is_set():
+        raise DownloadCancelled()
+    return rc
+
+def select_format(audio_only, quality):
+    # yt-dlp format string for the UI's quality settings
+    if audio_only:
+        return 'bestaudio/best'
+    if quality.endswith('p') and quality[:-1].isdigit():
+        # pick best video <= that height + best audio
+        return f'bestvideo[height<={quality[:-1]}]+bestaudio/best'
+    return 'bestvideo+bestaudio/best'
+
+# ---------------- Worker ----------------
+class DownloadWorker:
+    # Runs tasks on the App's thread pool; holds no thread of its own
+    YDL_CACHE_SIZE = 4  # per thread
+
+    def __init__(self, ui):
         self.ui = ui
-        self.running = True
-
-    def stop(self):
-        self.running = False
-
-    def run(self):
-        while self.running:
-            try:
-                task = self.q.get(timeout=0.5)
-            except queue.Empty:
-                continue
-            try:
-                self.process_task(task)
-            except Exception as e:
-                self.ui.log(f"Task error: {e}")
-            finally:
-                self.q.task_done()
+        self._local = threading.local()
+        # pool threads are joined at interpreter exit, so stopping has to
+        # make running downloads bail out; checked from the progress hook
+        self.cancel = threading.Event()
+
+    def get_ydl(self, ydl_opts, progress=None):
+        # Reuse one YoutubeDL per pool thread and option set; only the
+        # progress hook changes between tasks, so it is dispatched via a slot
+        cache = getattr(self._local, 'ydls', None)
+        if cache is None:
+            cache = self._local.ydls = {}
+        key = tuple(sorted((k, repr(v)) for k, v in ydl_opts.items() if k != 'progress_hooks'))
+        entry = cache.pop(key, None)
+        if entry is None:
+            slot = [None]
+            def dispatch(d):
+                if slot[0]:
+                    slot[0](d)
+            ydl = yt_dlp.YoutubeDL(dict(ydl_opts, progress_hooks=[dispatch]))
+            entry = (ydl, slot)
+            if len(cache) >= self.YDL_CACHE_SIZE:
+                cache.pop(next(iter(cache)))[0].close()  # least recently used
+        cache[key] = entry  # most recently used goes last
+        entry[1][0] = progress
+        return entry[0]
+
+    def run_task(self, task):
+        try:
+            self.process_task(task)
+        except Exception as e:
+            self.ui.log(f"Task error: {e}")
 
     def process_task(self, task):
         url, opts = task
+        if self.cancel.is_set():
+            return
         self.ui.log(f"Start: {url}")
         self.ui.schedule(lambda: self.ui.set_status("Downloading..."))
         ydl_opts = {
@@ -103,113 +211,164 @@ class DownloadWorker(threading.Thread):
             'noplaylist': opts['noplaylist'],
             'continuedl': True,
             'retries': 6,
+            # DASH/HLS: fetch several fragments at once
+            'concurrent_fragment_downloads': FRAGMENT_WORKERS,
             'no_warnings': True,
             'quiet': True,
+            'format': opts['format'],  # resolved by select_format when queued
         }
-
-        # format selection
-        if opts['audio_only']:
-            ydl_opts['format'] = 'bestaudio/best'
-        else:
-            q = opts['quality']
-            if q == 'best':
-                ydl_opts['format'] = 'bestvideo+bestaudio/best'
-            elif q.endswith('p') and q[:-1].isdigit():
-                # pick best video <= that height + best audio
-                ydl_opts['format'] = f'bestvideo[height<={q[:-1]}]+bestaudio/best'
-            else:
-                ydl_opts['format'] = 'bestvideo+bestaudio/best'
+        # subtitles are fetched by the same extraction as the media
+        sub_opts = {
+            'writesubtitles': True,
+            'writeautomaticsub': True,
+            'subtitleslangs': [opts['subs_lang']] if opts['subs_lang'] else ['en'],
+        } if opts['subs'] else {}
 
         # progress hook
+        # last state sent to the UI; kept per task since fragment
+        # downloads may call the hook from several threads
+        last = {'pct': -1.0, 't': 0.0}
+
         def progress(d):
+            if self.cancel.is_set():
+                raise DownloadCancelled()
             st = d.get('status')
             if st == 'downloading':
                 tb = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
                 db = d.get('downloaded_bytes') or 0
                 pct = (db / tb * 100) if tb else 0
-                self.ui.schedule(lambda: self.ui.update_progress(pct))
-                self.ui.schedule(lambda: self.ui.set_status(
-                    f"Downloading... {pct:.1f}% {human_size(db)} / {human_size(tb)}"
+                now = time.monotonic()
+                elapsed = now - last['t']
+                # at most 10 Hz; within 250 ms only for a visible change
+                if elapsed < 0.1 or (elapsed < 0.25 and abs(pct - last['pct']) < 0.5):
+                    return
+                last['pct'], last['t'] = pct, now
+                # one Tk event per tick for both bar and status text
+                self.ui.schedule(lambda p=pct, d=db, t=tb: (
+                    self.ui.update_progress(p),
+                    self.ui.set_status(f"Downloading... {p:.1f}% {human_size(d)} / {human_size(t)}"),
                 ))
             elif st == 'finished':
-                self.ui.schedule(lambda: self.ui.update_progress(100))
-                self.ui.schedule(lambda: self.ui.set_status("Finalizing..."))
-
-        ydl_opts['progress_hooks'] = [progress]
+                self.ui.schedule(lambda: (self.ui.update_progress(100), self.ui.set_status("Finalizing...")))
 
         # download
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            try:
+                ydl = self.get_ydl(dict(ydl_opts, **sub_opts), progress)
+                info = ydl.extract_info(url, download=True)
+            except DownloadError as e:
+                # only yt-dlp's own subtitle failure (YoutubeDL._write_subtitles)
+                if not sub_opts or 'Unable to download video subtitles' not in str(e):
+                    raise
+                # yt-dlp writes subs before the media, so a subtitle error
+                # (e.g. timedtext 429) would otherwise cost the video too
+                self.ui.log(f"Sub download failed: {e}; retrying without subtitles")
+                ydl = self.get_ydl(ydl_opts, progress)
                 info = ydl.extract_info(url, download=True)
-                out_file = ydl.prepare_filename(info)
+            out_file = ydl.prepare_filename(info)
+        except DownloadCancelled:
+            return
         except Exception as e:
             self.ui.log(f"Download failed: {e}")
             self.ui.schedule(lambda: messagebox.showerror("Download failed", str(e)))
             return
 
-        # convert audio to mp3 if requested
+        # hand ffmpeg work to the post-processing stage so this
+        # pool thread is free for the next download
+        if (opts['audio_only'] and opts['convert_mp3']) or opts['start'] or opts['end']:
+            pp_pool = self.ui.pp_pool
+            if pp_pool is None or self.cancel.is_set():
+                return  # stopped while downloading
+            try:
+                pp_pool.submit(self.run_post_process, (url, out_file, info.get('duration'), opts))
+            except RuntimeError:
+                pass  # shut down between the check and the submit
+        else:
+            self.finish_task(url, out_file)
+
+    def run_post_process(self, task):
+        try:
+            self.post_process(task)
+        except DownloadCancelled:
+            pass
+        except Exception as e:
+            self.ui.log(f"Post-processing error: {e}")
+
+    def post_process(self, task):
+        url, out_file, duration, opts = task
+        if self.cancel.is_set():
+            return
+        ss = normalize_ts(opts['start'])
+        to = normalize_ts(opts['end'])
+        # length of the ffmpeg output, for post-processing progress
+        start_s = ts_seconds(ss) if ss else 0
+        end_s = ts_seconds(to) if to else (duration or 0)
+        clip_len = max(end_s - start_s, 0)
+        def pp_progress(pct):
+            self.ui.schedule(lambda: self.ui.update_progress(pct))
+
+        # convert audio to mp3 if requested (trimmed in the same ffmpeg pass)
+        trimmed_done = False
         if opts['audio_only'] and opts['convert_mp3']:
             mp3_path = os.path.splitext(out_file)[0] + ".mp3"
+            tmp_path = os.path.splitext(out_file)[0] + ".tmp.mp3"
+            cmd = [FFMPEG_CMD, '-y']
+            if ss:
+                cmd += ['-ss', ss]
+            if to:
+                cmd += ['-to', to]
+            cmd += ['-i', out_file, '-vn', '-ab', '192k', '-ar', '44100', tmp_path]
+            self.ui.schedule(lambda: self.ui.set_status("Converting to MP3..."))
             try:
-                subprocess.run([FFMPEG_CMD, '-y', '-i', out_file, '-vn', '-ab', '192k', '-ar', '44100', mp3_path],
-                               check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                os.remove(out_file)
-                out_file = mp3_path
+                rc = run_ffmpeg(cmd, clip_len, pp_progress, self.cancel)
+                if rc != 0:
+                    raise subprocess.CalledProcessError(rc, cmd)
+                out_file = replace_output(tmp_path, mp3_path, out_file)
+                trimmed_done = True
+            except DownloadCancelled:
+                discard(tmp_path)
+                raise
             except Exception as e:
+                discard(tmp_path)
                 self.ui.log(f"MP3 conversion failed: {e}")
 
-        # trimming
-        if opts['start'] or opts['end']:
-            def normalize(ts):
-                s = ts.strip()
-                if not s:
-                    return None
-                if ':' in s:
-                    return s
-                try:
-                    sec = int(float(s))
-                    h = sec // 3600
-                    m = (sec % 3600) // 60
-                    sec = sec % 60
-                    return f"{h:02d}:{m:02d}:{sec:02d}"
-                except:
-                    return None
-            ss = normalize(opts['start'])
-            to = normalize(opts['end'])
-            trimmed = os.path.splitext(out_file)[0] + "_trimmed" + os.path.splitext(out_file)[1]
-            cmd = [FFMPEG_CMD, '-y', '-i', out_file]
+        # trimming (also when MP3 conversion failed, on the original file)
+        if (ss or to) and not trimmed_done:
+            base, ext = os.path.splitext(out_file)
+            # keep the clip under its own name: yt-dlp would otherwise treat
+            # a re-queued URL as already downloaded and re-trim the clip
+            final = base + "_trimmed" + ext
+            trimmed = base + ".trim" + ext
+            # seek on the input (container-level) instead of decoding up to ss;
+            # output timestamps then start at 0, so -to becomes relative to ss
+            cmd = [FFMPEG_CMD, '-y']
             if ss:
                 cmd += ['-ss', ss]
+            cmd += ['-i', out_file]
             if to:
+                if ss:
+                    to = f"{clip_len:.3f}"
                 cmd += ['-to', to]
             cmd_copy = cmd + ['-c', 'copy', trimmed]
+            self.ui.schedule(lambda: self.ui.set_status("Trimming..."))
             try:
-                res = subprocess.run(cmd_copy, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                if res.returncode != 0:
+                if run_ffmpeg(cmd_copy, clip_len, pp_progress, self.cancel) != 0:
                     # fallback re-encode
                     cmd_re = cmd + ['-c:v', 'libx264', '-c:a', 'aac', trimmed]
-                    subprocess.run(cmd_re, check=True)
-                os.remove(out_file)
-                out_file = trimmed
+                    rc = run_ffmpeg(cmd_re, clip_len, pp_progress, self.cancel)
+                    if rc != 0:
+                        raise subprocess.CalledProcessError(rc, cmd_re)
+                out_file = replace_output(trimmed, final, out_file)
+            except DownloadCancelled:
+                discard(trimmed)
+                raise
             except Exception as e:
+                discard(trimmed)
                 self.ui.log(f"Trim failed: {e}")
 
-        # subtitles
-        if opts['subs']:
-            try:
-                sub_opts = {
-                    'skip_download': True,
-                    'writesubtitles': True,
-                    'writeautomaticsub': True,
-                    'subtitleslangs': [opts['subs_lang']] if opts['subs_lang'] else ['en'],
-                    'outtmpl': os.path.join(opts['save_folder'], '%(title).120s.%(ext)s'),
-                    'quiet': True,
-                }
-                with yt_dlp.YoutubeDL(sub_opts) as yd:
-                    yd.download([url])
-            except Exception as e:
-                self.ui.log(f"Sub download failed: {e}")
+        self.finish_task(url, out_file)
 
+    def finish_task(self, url, out_file):
         # final UI updates
         self.ui.schedule(lambda: self.ui.add_history(url, out_file))
         self.ui.schedule(lambda: self.ui.update_progress(0))
@@ -224,9 +383,14 @@ class App:
         root.geometry("820x620")
 
         # Data
-        self.tasks_q = queue.Queue()
-        self.workers = []
+        self.pending = []  # tasks added before the queue is started
+        self.futures = []
+        self.pool = None
+        self.pp_pool = None
+        self.worker = DownloadWorker(self)
         self.max_workers = MAX_WORKERS
+        self._info_cache = OrderedDict()  # url -> (fetched_at, info), LRU
+        self._opts_cache = {}  # identical task settings share one (read-only) dict
         self.history = self.load_history()
 
         # UI Variables
@@ -308,11 +472,9 @@ class App:
         self.log_area.pack(fill='x', padx=10, pady=6)
 
         self.set_status("Ready")
-        self.refresh_history_list()
+        self._rebuild_history_list()
 
-        # initialize default workers collection (not started)
-        self.tasks_q = queue.Queue()
-        self.workers = []
+        # pool is created on Start Queue
         self.update_workers()
 
     # --- UI helpers ---
@@ -334,31 +496,79 @@ class App:
             pass
 
     def load_history(self):
+        # returns newest first; compacts the log if it held junk or duplicates
+        items, seen, dirty = [], set(), False
         try:
             if os.path.exists(HISTORY_FILE):
-                with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # binary, so a line cut inside a multibyte character is
+                # just one bad record (UnicodeDecodeError is a ValueError)
+                with open(HISTORY_FILE, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            item = json.loads(line)
+                            key = (item['time'], item['url'], item['file'])
+                            hash(key)
+                        except (ValueError, TypeError, KeyError):
+                            dirty = True  # e.g. truncated last line
+                            continue
+                        if key in seen:
+                            dirty = True
+                            continue
+                        seen.add(key)
+                        items.append(item)
+            elif os.path.exists(LEGACY_HISTORY_FILE):
+                with open(LEGACY_HISTORY_FILE, 'r', encoding='utf-8') as f:
+                    items = json.load(f)[::-1]
+                dirty = True
+        except:
+            # unreadable file: never compact a partial list over it
+            dirty = False
+        items.reverse()
+        if dirty:
+            self.save_history(items)
+        return items
+
+    def save_history(self, items):
+        # full rewrite, only used for compaction; normal adds append
+        try:
+            tmp = HISTORY_FILE + ".tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                for item in reversed(items):
+                    f.write(json.dumps(item, ensure_ascii=False) + '\n')
+            os.replace(tmp, HISTORY_FILE)
         except:
             pass
-        return []
 
-    def save_history(self):
+    def _append_history(self, item):
         try:
-            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, ensure_ascii=False, indent=2)
+            with open(HISTORY_FILE, 'a+b') as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')  # previous write was cut short
+                f.write((json.dumps(item, ensure_ascii=False) + '\n').encode('utf-8'))
         except:
             pass
 
     def add_history(self, url, filepath):
         item = {'time': time.time(), 'url': url, 'file': filepath}
         self.history.insert(0, item)
-        self.save_history()
-        self.refresh_history_list()
+        self._append_history(item)
+        self.history_listbox.insert(0, self.format_history(item))
+        if self.history_listbox.size() > HISTORY_ROWS:
+            self.history_listbox.delete('end')
 
-    def refresh_history_list(self):
+    def format_history(self, h):
+        return f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(h['time']))}  {os.path.basename(h['file'])}"
+
+    def _rebuild_history_list(self):
+        # full redraw, only needed at startup
         self.history_listbox.delete(0, 'end')
-        for h in self.history[:100]:
-            self.history_listbox.insert('end', f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(h['time']))}  {os.path.basename(h['file'])}")
+        for h in self.history[:HISTORY_ROWS]:
+            self.history_listbox.insert('end', self.format_history(h))
 
     def open_history_folder(self):
         folder = self.save_folder.get()
@@ -390,6 +600,20 @@ class App:
         if self.audio_only.get():
             self.quality.set('audio')
 
+    def get_info(self, url):
+        cached = self._info_cache.get(url)
+        if cached and time.time() - cached[0] < INFO_CACHE_TTL:
+            self._info_cache.move_to_end(url)
+            return cached[1]
+        ydl_opts = {'quiet': True, 'no_warnings': True, 'skip_download': True}
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        self._info_cache[url] = (time.time(), info)
+        self._info_cache.move_to_end(url)
+        while len(self._info_cache) > INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        return info
+
     def estimate(self):
         url = self.url.get().strip()
         if not url:
@@ -397,9 +621,7 @@ class App:
             return
         # quick info fetch (no download), find estimated size for chosen format
         try:
-            ydl_opts = {'quiet': True, 'no_warnings': True, 'skip_download': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = self.get_info(url)
             # choose format estimate
             if self.audio_only.get():
                 # estimate best audio abr
@@ -455,27 +677,42 @@ class App:
             'subs_lang': self.subs_lang.get(),
             'noplaylist': False if 'playlist' in url.lower() else True
         }
-        self.tasks_q.put((url, opts))
+        opts['format'] = select_format(opts['audio_only'], opts['quality'])
+        opts = self._opts_cache.setdefault(tuple(sorted(opts.items())), opts)
+        if self.pool is not None:
+            self.submit_task((url, opts))
+        else:
+            self.pending.append((url, opts))
         self.queue_listbox.insert('end', f"{url} [{opts['quality']}]")
         self.log("Added to queue.")
 
+    def submit_task(self, task):
+        self.futures = [fut for fut in self.futures if not fut.done()]
+        self.futures.append(self.pool.submit(self.worker.run_task, task))
+
     def clear_queue(self):
-        with self.tasks_q.mutex:
-            self.tasks_q.queue.clear()
+        self.pending.clear()
+        for fut in self.futures:
+            fut.cancel()  # only affects tasks not yet started
+        self.futures.clear()
         self.queue_listbox.delete(0, 'end')
         self.log("Queue cleared.")
 
     def start_workers(self):
-        if len(self.workers) > 0:
+        if self.pool is not None:
             messagebox.showinfo("Info", "Workers already running.")
             return
         cnt = self.worker_count_var.get()
         self.max_workers = max(1, int(cnt))
-        for _ in range(self.max_workers):
-            w = DownloadWorker(self.tasks_q, self)
-            w.start()
-            self.workers.append(w)
-        self.log(f"Started {len(self.workers)} workers.")
+        self.worker.cancel.clear()
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="download")
+        # ffmpeg trims/conversions get their own stage, so concurrent
+        # downloads don't mean concurrent ffmpeg processes
+        self.pp_pool = ThreadPoolExecutor(max_workers=PP_WORKERS, thread_name_prefix="postprocess")
+        for task in self.pending:
+            self.submit_task(task)
+        self.pending.clear()
+        self.log(f"Started {self.max_workers} workers.")
         self.set_status("Running")
 
     def update_workers(self):
@@ -484,9 +721,16 @@ class App:
         self.log(f"Worker limit set to {self.max_workers}")
 
     def stop_workers(self):
-        for w in self.workers:
-            w.stop()
-        self.workers.clear()
+        # running downloads stop at their next progress tick, so closing
+        # the window doesn't leave them running headless
+        self.worker.cancel.set()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        if self.pp_pool is not None:
+            self.pp_pool.shutdown(wait=False, cancel_futures=True)
+            self.pp_pool = None
+        self.futures.clear()
         self.set_status("Ready")
         self.log("Workers stopped.")
 
@@ -501,15 +745,29 @@ class App:
             pass
 
 # ---------------- Run ----------------
-if __name__ == "__main__":
-    # quick ffmpeg check
+def probe_ffmpeg(done, result):
+    # runs off the UI thread; result['ok'] is read once `done` is set
     try:
         subprocess.run([FFMPEG_CMD, "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        result['ok'] = True
     except Exception:
-        tk.messagebox.showwarning("FFmpeg not found", "FFmpeg not detected in PATH. Trimming/MP3 conversion will fail without it.")
+        result['ok'] = False
+    done.set()
+
+def report_ffmpeg(root, done, result):
+    if not done.is_set():
+        root.after(100, report_ffmpeg, root, done, result)
+    elif not result['ok']:
+        messagebox.showwarning("FFmpeg not found", "FFmpeg not detected in PATH. Trimming/MP3 conversion will fail without it.")
+
+if __name__ == "__main__":
+    # quick ffmpeg check, in the background so the window paints immediately
+    ffmpeg_done, ffmpeg_result = threading.Event(), {}
+    threading.Thread(target=probe_ffmpeg, args=(ffmpeg_done, ffmpeg_result), daemon=True).start()
 
     root = ThemedTk(theme="arc")
     app = App(root)
+    report_ffmpeg(root, ffmpeg_done, ffmpeg_result)
     try:
         root.mainloop()
     finally: